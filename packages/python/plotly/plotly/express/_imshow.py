@@ -1,34 +1,33 @@
 import plotly.graph_objs as go
 from _plotly_utils.basevalidators import ColorscaleValidator
+from _plotly_utils.optional_imports import get_module
 from ._core import apply_default_cascade, init_figure, configure_animation_controls
 from .imshow_utils import rescale_intensity, _integer_ranges, _integer_types
 import pandas as pd
 import numpy as np
 import itertools
+import numbers
+import warnings
 from plotly.utils import image_array_to_data_uri
 
-try:
-    import xarray
-
-    xarray_imported = True
-except ImportError:
-    xarray_imported = False
-
 _float_types = []
+_integer_types_set = frozenset(_integer_types)
+_colorscale_validator = ColorscaleValidator("colorscale", "imshow")
 
 
 def _vectorize_zvalue(z, mode="max"):
-    alpha = 255 if mode == "max" else 0
     if z is None:
         return z
-    elif np.isscalar(z):
-        return [z] * 3 + [alpha]
-    elif len(z) == 1:
-        return list(z) * 3 + [alpha]
-    elif len(z) == 3:
-        return list(z) + [alpha]
-    elif len(z) == 4:
+    alpha = 255 if mode == "max" else 0
+    if isinstance(z, (numbers.Number, np.number)):
+        return (z, z, z, alpha)
+    n = len(z)
+    if n == 4:
         return z
+    elif n == 3:
+        return (z[0], z[1], z[2], alpha)
+    elif n == 1:
+        return (z[0], z[0], z[0], alpha)
     else:
         raise ValueError(
             "zmax can be a scalar, or an iterable of length 1, 3 or 4. "
@@ -39,10 +38,20 @@ def _vectorize_zvalue(z, mode="max"):
 def _infer_zmax_from_type(img):
     dt = img.dtype.type
     rtol = 1.05
-    if dt in _integer_types:
+    if dt in _integer_types_set:
         return _integer_ranges[dt][1]
     else:
-        im_max = img[np.isfinite(img)].max()
+        # single pass ignoring NaNs; only mask infinite values if there are any
+        bn = get_module("bottleneck")
+        nanmax = bn.nanmax if bn is not None else np.nanmax
+        with warnings.catch_warnings():
+            # all-NaN images are handled below with the infinite values
+            warnings.simplefilter("ignore", RuntimeWarning)
+            im_max = nanmax(img)
+        if not np.isfinite(im_max):
+            finite = img[np.isfinite(img)]
+            # no finite value to infer the range from: use the smallest one
+            im_max = finite.max() if finite.size else 0
         if im_max <= 1 * rtol:
             return 1
         elif im_max <= 255 * rtol:
@@ -53,6 +62,62 @@ def _infer_zmax_from_type(img):
             return 2 ** 32
 
 
+def _minmax(img, chunk_bytes=2 ** 19):
+    """Return the min and max of `img`, reading the data from memory only once.
+
+    Large contiguous arrays are reduced chunk by chunk so that each chunk is
+    still in cache when its max is computed after its min. For 1 and 2 byte
+    dtypes the reductions are fast enough that two plain passes are cheaper.
+    Array subclasses such as masked arrays use their own min and max.
+    """
+    chunk_size = chunk_bytes // img.itemsize
+    if (
+        type(img) is not np.ndarray
+        or not img.flags.c_contiguous
+        or img.itemsize <= 2
+        or img.size <= chunk_size
+    ):
+        return img.min(), img.max()
+    flat = img.ravel()
+    im_min, im_max = flat[0], flat[0]
+    for start in range(0, flat.size, chunk_size):
+        chunk = flat[start : start + chunk_size]
+        im_min = np.minimum(im_min, chunk.min())
+        im_max = np.maximum(im_max, chunk.max())
+    return im_min, im_max
+
+
+def _downsample(img, max_size):
+    """Average blocks of pixels so that the last two axes of `img` are at most
+    `max_size` long. Return the downsampled image and the block size along
+    each of these axes.
+    """
+    ny, nx = img.shape[-2:]
+    y_step = max(1, -(-ny // max_size))
+    x_step = max(1, -(-nx // max_size))
+    if y_step == 1 and x_step == 1:
+        return img, 1, 1
+    ny, nx = ny // y_step, nx // x_step
+    img = img[..., : ny * y_step, : nx * x_step]
+    img = img.reshape(img.shape[:-2] + (ny, y_step, nx, x_step))
+    return img.mean(axis=(-3, -1)), y_step, x_step
+
+
+def _downsample_coords(coords, n, step):
+    """Return the coordinates of the centers of `n` blocks of `step` pixels.
+
+    If `coords` is None, pixel indices of the original image are used.
+    Non-numerical coordinates are represented by the label of the middle pixel
+    of each block.
+    """
+    if coords is None:
+        return np.arange(n) * step + (step - 1) / 2
+    coords = np.asanyarray(coords)
+    if np.issubdtype(coords.dtype, np.number):
+        return coords[: n * step].reshape(n, step).mean(axis=1)
+    return coords[step // 2 : n * step : step]
+
+
 def imshow(
     img,
     zmin=None,
@@ -79,6 +144,7 @@ def imshow(
     binary_backend="auto",
     binary_compression_level=4,
     binary_format="png",
+    max_size=None,
 ):
     """
     Display an image, i.e. data on a 2D regular raster.
@@ -208,6 +274,15 @@ def imshow(
         since it uses lossless compression, but 'jpg' (lossy) compression can
         result if smaller binary strings for natural images.
 
+    max_size: int, optional (default None)
+        maximal number of pixels along each axis of single-channel images
+        displayed as a heatmap (ie when `binary_string` is False). Larger images
+        are downsampled by averaging blocks of pixels, which reduces the size of
+        the figure sent to the browser at the cost of resolution. Rows and
+        columns which do not fill a complete block are dropped, and `x` and `y`
+        are set to the centers of the blocks. If None, the image is displayed at
+        full resolution.
+
     Returns
     -------
     fig : graph_objects.Figure containing the displayed image
@@ -227,8 +302,28 @@ def imshow(
     If an xarray is passed, dimensions names and coordinates are used for
     axes labels and ticks.
     """
-    args = locals()
+    # only the arguments read by apply_default_cascade, init_figure and
+    # configure_animation_controls, rather than a copy of locals()
+    args = dict(
+        template=template,
+        width=width,
+        height=height,
+        title=title,
+        labels=labels,
+        color_continuous_scale=color_continuous_scale,
+        animation_frame=animation_frame,
+        facet_col_wrap=facet_col_wrap,
+        facet_col_spacing=facet_col_spacing,
+        facet_row_spacing=facet_row_spacing,
+    )
     apply_default_cascade(args)
+    if max_size is not None and (
+        not isinstance(max_size, numbers.Integral) or max_size < 1
+    ):
+        raise ValueError(
+            "max_size must be an integer of at least 1, "
+            "but a value of %s was passed." % str(max_size)
+        )
     labels = labels.copy()
     nslices_facet = 1
     if facet_col is not None:
@@ -257,7 +352,9 @@ def imshow(
     animation_label = None
     img_is_xarray = False
     # ----- Define x and y, set labels if img is an xarray -------------------
-    if xarray_imported and isinstance(img, xarray.DataArray):
+    # a DataArray can only be passed if xarray was imported by the caller
+    xarray = get_module("xarray", should_load=False)
+    if xarray is not None and isinstance(img, xarray.DataArray):
         dims = list(img.dims)
         img_is_xarray = True
         if facet_col is not None:
@@ -272,7 +369,7 @@ def imshow(
         # np.datetime64 is not handled correctly by go.Heatmap
         for ax in [x_label, y_label]:
             if np.issubdtype(img.coords[ax].dtype, np.datetime64):
-                img.coords[ax] = img.coords[ax].astype(str)
+                img = img.assign_coords({ax: img.coords[ax].values.astype(str)})
         if x is None:
             x = img.coords[x_label].values
         if y is None:
@@ -320,7 +417,10 @@ def imshow(
         is_dataframe = False
 
     # --------------- Starting from here img is always a numpy array --------
-    img = np.asanyarray(img)
+    if img_is_xarray:
+        img = img.values
+    elif not isinstance(img, np.ndarray):
+        img = np.asanyarray(img)
     # Reshape array so that animation dimension comes first, then facets, then images
     if facet_col is not None:
         img = np.moveaxis(img, facet_col, 0)
@@ -346,8 +446,8 @@ def imshow(
         binary_string = img.ndim >= (3 + slice_dimensions) and not is_dataframe
 
     # Cast bools to uint8 (also one byte)
-    if img.dtype == np.bool:
-        img = 255 * img.astype(np.uint8)
+    if img.dtype.kind == "b":
+        img = np.multiply(img, 255, dtype=np.uint8)
 
     if range_color is not None:
         zmin = range_color[0]
@@ -360,13 +460,15 @@ def imshow(
     # We try to set zmin and zmax only if necessary, because traces have good defaults
     if contrast_rescaling == "minmax":
         # When using binary_string and minmax we need to set zmin and zmax to rescale the image
+        if binary_string and zmin is None and zmax is None:
+            zmin, zmax = _minmax(img)
         if (zmin is not None or binary_string) and zmax is None:
             zmax = img.max()
         if (zmax is not None or binary_string) and zmin is None:
             zmin = img.min()
     else:
         # For uint8 data and infer we let zmin and zmax to be None if passed as None
-        if zmax is None and img.dtype != np.uint8:
+        if zmax is None and img.dtype.type is not np.uint8:
             zmax = _infer_zmax_from_type(img)
         if zmin is None and zmax is not None:
             zmin = 0
@@ -385,6 +487,11 @@ def imshow(
                 "The length of the x vector must match the length of the second "
                 + "dimension of the img matrix."
             )
+        if max_size is not None:
+            img, y_step, x_step = _downsample(img, max_size)
+            if y_step > 1 or x_step > 1:
+                x = _downsample_coords(x, img.shape[x_index], x_step)
+                y = _downsample_coords(y, img.shape[y_index], y_step)
         traces = [
             go.Heatmap(x=x, y=y, z=img[index_tup], coloraxis="coloraxis1", name=str(i))
             for i, index_tup in enumerate(itertools.product(*iterables))
@@ -394,9 +501,8 @@ def imshow(
         if aspect == "equal":
             layout["xaxis"] = dict(scaleanchor="y", constrain="domain")
             layout["yaxis"]["constrain"] = "domain"
-        colorscale_validator = ColorscaleValidator("colorscale", "imshow")
         layout["coloraxis1"] = dict(
-            colorscale=colorscale_validator.validate_coerce(
+            colorscale=_colorscale_validator.validate_coerce(
                 args["color_continuous_scale"]
             ),
             cmid=color_continuous_midpoint,
@@ -6,7 +6,10 @@ from PIL import Image
 from io import BytesIO
 import base64
 import datetime
+import warnings
+from fractions import Fraction
 from plotly.express.imshow_utils import rescale_intensity
+from plotly.express._imshow import _minmax
 
 img_rgb = np.array([[[255, 0, 0], [0, 255, 0], [0, 0, 255]]], dtype=np.uint8)
 img_gray = np.arange(100, dtype=np.float).reshape((10, 10))
@@ -41,6 +44,8 @@ def test_zmax():
     ]:
         fig = px.imshow(img_rgb, zmax=zmax, binary_string=False)
         assert fig.data[0]["zmax"] == (100, 100, 100, 255)
+    fig = px.imshow(img_rgb, zmax=Fraction(100), binary_string=False)
+    assert fig.data[0]["zmax"] == (100, 100, 100, 255)
 
 
 def test_automatic_zmax_from_dtype():
@@ -48,14 +53,14 @@ def test_automatic_zmax_from_dtype():
         np.uint8: 2 ** 8 - 1,
         np.uint16: 2 ** 16 - 1,
         np.float: 1,
-        np.bool: 255,
+        np.bool_: 255,
     }
     for key, val in dtypes_dict.items():
         img = np.array([0, 1], dtype=key)
         img = np.dstack((img,) * 3)
         fig = px.imshow(img, binary_string=False)
         # For uint8 in "infer" mode we don't pass zmin/zmax unless specified
-        if key in [np.uint8, np.bool]:
+        if key in [np.uint8, np.bool_]:
             assert fig.data[0]["zmax"] is None
         else:
             assert fig.data[0]["zmax"] == (val, val, val, 255)
@@ -148,6 +153,64 @@ def test_zmax_floats():
         assert fig.data[0]["zmax"] is None
 
 
+def test_zmax_floats_non_finite():
+    img = np.ones((5, 5, 3))
+    img[0, 0] = np.nan
+    img[1, 1] = np.inf
+    img[2, 2] = -np.inf
+    fig = px.imshow(img, binary_string=False)
+    assert fig.data[0]["zmax"] == (1, 1, 1, 255)
+    for value in [np.nan, np.inf]:
+        img = np.full((5, 5, 3), value)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            fig = px.imshow(img, binary_string=False)
+        assert fig.data[0]["zmax"] == (1, 1, 1, 255)
+
+
+def test_minmax():
+    img = np.random.random((300, 400))
+    img[150, 200] = -1
+    img[10, 300] = 2
+    assert _minmax(img) == (-1, 2)
+    assert _minmax(img.T) == (-1, 2)
+    img[200, 100] = np.nan
+    assert np.all(np.isnan(_minmax(img)))
+    img = np.random.randint(1, 255, size=(1000, 1000)).astype(np.uint8)
+    img[500, 500] = 0
+    assert _minmax(img) == (0, img.max())
+    img = np.ma.masked_array(np.random.random((1000, 1000)))
+    img[0, 0] = np.ma.masked
+    assert _minmax(img) == (img.min(), img.max())
+    fig = px.imshow(img, binary_string=True)
+    assert fig.data[0].source[:14] == "data:image/png"
+
+
+def test_max_size():
+    img = np.arange(100 * 90, dtype=np.float64).reshape((100, 90))
+    fig = px.imshow(img, x=np.arange(90), max_size=30)
+    z = np.asarray(fig.data[0].z)
+    assert z.shape == (25, 30)
+    assert z[0, 0] == img[:4, :3].mean()
+    # blocks are placed at the center of the pixels they average
+    assert np.all(np.asarray(fig.data[0].x) == np.arange(1, 90, 3))
+    fig = px.imshow(img, max_size=30)
+    assert np.all(np.asarray(fig.data[0].x) == np.arange(1, 90, 3))
+    assert np.all(np.asarray(fig.data[0].y) == np.arange(1.5, 100, 4))
+    fig = px.imshow(img[:6, :6], x=list("abcdef"), max_size=2)
+    assert list(fig.data[0].x) == ["b", "e"]
+    for max_size in [0, 30.5]:
+        with pytest.raises(ValueError, match="max_size"):
+            px.imshow(img, max_size=max_size)
+    with pytest.raises(ValueError, match="max_size"):
+        px.imshow(img_rgb, max_size=0)
+    # small images and RGB images are left unchanged
+    fig = px.imshow(img, max_size=100)
+    assert np.asarray(fig.data[0].z).shape == img.shape
+    fig = px.imshow(img_rgb, max_size=1)
+    assert fig.data[0].source == px.imshow(img_rgb).data[0].source
+
+
 def test_zmin_zmax_range_color():
     img = img_gray / 100.0
     fig = px.imshow(img)
@@ -194,6 +257,18 @@ def test_imshow_xarray_slicethrough():
     assert np.all(np.array(fig.data[0].x) == np.array(da.coords["dim_2"]))
 
 
+def test_imshow_xarray_datetime():
+    img = np.random.random((3, 4))
+    times = np.array(
+        ["2000-01-01T00", "2000-01-01T01", "2000-01-01T02"], dtype="datetime64[ns]"
+    )
+    da = xr.DataArray(img, dims=["time", "dim_cols"], coords={"time": times})
+    fig = px.imshow(da)
+    assert fig.data[0].y[0] == str(times[0])
+    # the coordinates of the input DataArray are left untouched
+    assert np.issubdtype(da.coords["time"].dtype, np.datetime64)
+
+
 def test_imshow_labels_and_ranges():
     fig = px.imshow([[1, 2], [3, 4], [5, 6]],)
     assert fig.layout.xaxis.title.text is None